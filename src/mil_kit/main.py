@@ -1,9 +1,7 @@
 import argparse
 import sys
 from importlib.metadata import version
-
-from mil_kit.psd.batch import BatchJob
-from mil_kit.watermark.batch import WatermarkJob
+from typing import List, Optional
 
 
 def get_version() -> str:
@@ -64,37 +62,14 @@ def add_common_args(parser: argparse.ArgumentParser) -> None:
     )
 
 
-def get_arg() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
-        description="Batch process PSD files and apply watermarks.",
-    )
-    parser.add_argument(
-        "-v", "--version",
-        action="version",
-        version=get_version(),
-        help="Show program's version number and exit",
-    )
+def add_export_args(parser: argparse.ArgumentParser) -> None:
+    add_common_args(parser)
 
-    subparsers = parser.add_subparsers(
-        dest="command",
-        metavar="<command>",
-    )
 
-    # --- export subcommand ---
-    export_parser = subparsers.add_parser(
-        "export",
-        help="Batch hide text layers in PSDs and export images",
-    )
-    add_common_args(export_parser)
+def add_watermark_args(parser: argparse.ArgumentParser) -> None:
+    add_common_args(parser)
 
-    # --- watermark subcommand ---
-    watermark_parser = subparsers.add_parser(
-        "watermark",
-        help="Apply a copyright watermark to a directory of images",
-    )
-    add_common_args(watermark_parser)
-
-    watermark_source = watermark_parser.add_argument_group(
+    watermark_source = parser.add_argument_group(
         "watermark source (at least one required)"
     )
     watermark_source.add_argument(
@@ -114,17 +89,67 @@ def get_arg() -> argparse.ArgumentParser:
         ),
     )
 
-    watermark_parser.add_argument(
+    parser.add_argument(
         "--opacity",
         type=float,
         default=0.8,
         help="Watermark opacity between 0.0 and 1.0 (default: 0.8)",
     )
 
+
+def get_arg(argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+    """
+    Build the CLI parser.
+
+    Every subcommand is registered so it shows up in the top-level help, but
+    only the one named in ``argv`` (defaults to ``sys.argv[1:]``) has its
+    arguments populated. Each invocation runs exactly one subcommand, so the
+    others never need building.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    selected = next((arg for arg in argv if not arg.startswith("-")), None)
+
+    parser = argparse.ArgumentParser(
+        description="Batch process PSD files and apply watermarks.",
+    )
+    parser.add_argument(
+        "-v", "--version",
+        action="version",
+        version=get_version(),
+        help="Show program's version number and exit",
+    )
+
+    subparsers = parser.add_subparsers(
+        dest="command",
+        metavar="<command>",
+    )
+    subparsers.required = True
+
+    # --- export subcommand ---
+    export_parser = subparsers.add_parser(
+        "export",
+        help="Batch hide text layers in PSDs and export images",
+    )
+    export_parser.set_defaults(func=run_export)
+    if selected == "export":
+        add_export_args(export_parser)
+
+    # --- watermark subcommand ---
+    watermark_parser = subparsers.add_parser(
+        "watermark",
+        help="Apply a copyright watermark to a directory of images",
+    )
+    watermark_parser.set_defaults(func=run_watermark)
+    if selected == "watermark":
+        add_watermark_args(watermark_parser)
+
     return parser
 
 
 def run_export(args: argparse.Namespace) -> None:
+    from mil_kit.psd.batch import BatchJob
+
     job = BatchJob(
         input_dir=args.dir,
         output_dir=args.output,
@@ -148,6 +173,8 @@ def run_watermark(args: argparse.Namespace) -> None:
         )
         sys.exit(1)
 
+    from mil_kit.watermark.batch import WatermarkJob
+
     job = WatermarkJob(
         input_dir=args.dir,
         meta_file=args.meta_file,
@@ -170,17 +197,8 @@ def main() -> None:
     parser = get_arg()
     args = parser.parse_args()
 
-    if args.command is None:
-        parser.print_help(sys.stderr)
-        sys.exit(1)
-
-    handlers = {
-        "export": run_export,
-        "watermark": run_watermark,
-    }
-
     try:
-        handlers[args.command](args)
+        args.func(args)
     except Exception as e:
         print(f"Critical Error: {e}", file=sys.stderr)
         sys.exit(1)
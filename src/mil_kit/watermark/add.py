@@ -1,10 +1,28 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
+import io
+import math
 
 from PIL import Image, ImageDraw, ImageFont
 import os
 
+_FONT_CANDIDATES = (
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    "/Library/Fonts/Arial Bold.ttf",
+    "C:/Windows/Fonts/arialbd.ttf",
+)
+
+# Resolved once at import so per-image font loads skip the filesystem probe.
+_FONT_PATH = next((p for p in _FONT_CANDIDATES if os.path.exists(p)), None)
+
+
+@lru_cache(maxsize=64)
+def _cached_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Return a parsed TrueType font, memoised by ``(path, size)``."""
+    return ImageFont.truetype(path, size)
+
 
 class WatermarkProcessor:
     """
@@ -32,18 +50,35 @@ class WatermarkProcessor:
             is prepended automatically if not already present.
         opacity (float): Watermark opacity in the range [0.0, 1.0], where
             0.0 is fully transparent and 1.0 is fully opaque.
-        image (Image.Image | None): The loaded source image in RGBA mode.
-            ``None`` until ``load()`` is called.
+        image (Image.Image | None): The loaded source image, kept in RGB
+            mode for RGB sources and converted to RGBA otherwise. ``None``
+            until ``load()`` is called.
         watermarked (Image.Image | None): The composited result after
-            ``apply_text_watermark()`` is called. ``None`` beforehand.
+            ``apply_text_watermark()`` is called. ``None`` beforehand. The
+            watermark is blended into ``image`` in place, so both attributes
+            refer to the same object once it has been applied.
 
     Example:
         >>> processor = WatermarkProcessor("photo.png", watermark_text="2024 Studio Name", opacity=0.8)
-        >>> processor.load()
+        >>> processor.load(max_resolution=1920)
         >>> processor.apply_text_watermark()
         >>> processor.export("output/photo.png", format="png", max_resolution=1920)
+
+    For batch use, ``load(data=...)`` and ``to_bytes()`` let the caller do
+    its own file I/O, so only encoded bytes need to cross process
+    boundaries (see ``mil_kit.watermark.batch``).
     """
 
+    __slots__ = (
+        "file_path",
+        "watermark_text",
+        "opacity",
+        "image",
+        "watermarked",
+        "_bg_rgba",
+        "_text_rgba",
+    )
+
     _COPYRIGHT_SYMBOL = "©"
     _PADDING = 8
     _MARGIN = 4
@@ -53,12 +88,18 @@ class WatermarkProcessor:
     _BACKGROUND_COLOR = (0, 0, 0)
     _TEXT_COLOR = (255, 255, 255)
     _CORNER_RADIUS = 6
+    _NATIVE_MODES = ("RGB", "RGBA")
+    # Encoder settings tuned for batch throughput over minimum file size.
+    _SAVE_OPTIONS = {
+        "png": {"compress_level": 1},
+    }
 
     def __init__(
         self,
         file_path: str,
         watermark_text: str,
         opacity: float = 0.8,
+        prepend_copyright: bool = True,
     ) -> None:
         """
         Initialises the processor with a source file path and watermark settings.
@@ -72,6 +113,10 @@ class WatermarkProcessor:
                 ``"© 2024 Studio"``).
             opacity (float): Watermark opacity between 0.0 (invisible) and
                 1.0 (fully opaque). Defaults to 0.8.
+            prepend_copyright (bool): Whether to prepend ``©`` to
+                ``watermark_text``. Pass ``False`` when the text has already
+                been prefixed with ``with_copyright()``, e.g. once per batch
+                rather than once per file. Defaults to True.
 
         Raises:
             ValueError: If ``watermark_text`` is empty or ``opacity`` is
@@ -84,27 +129,79 @@ class WatermarkProcessor:
 
         self.file_path = Path(file_path)
         self.watermark_text = (
-            watermark_text
-            if watermark_text.startswith(self._COPYRIGHT_SYMBOL)
-            else f"{self._COPYRIGHT_SYMBOL} {watermark_text}"
+            self.with_copyright(watermark_text)
+            if prepend_copyright
+            else watermark_text
         )
         self.opacity = opacity
+        # Fill colours depend only on opacity, so build them once per processor.
+        self._bg_rgba = (*self._BACKGROUND_COLOR, int(180 * opacity))
+        self._text_rgba = (*self._TEXT_COLOR, int(255 * opacity))
 
         self.image: Image.Image | None = None
         self.watermarked: Image.Image | None = None
 
-    def load(self) -> None:
+    @classmethod
+    def with_copyright(cls, text: str) -> str:
         """
-        Opens the source image from ``file_path`` and converts it to RGBA mode.
+        Return ``text`` prefixed with ``©`` unless it already starts with it.
 
-        Converting to RGBA ensures a consistent alpha channel is present before
-        compositing, regardless of the original image mode (e.g. RGB, L, P).
+        Args:
+            text (str): Watermark text.
+
+        Returns:
+            str: The text in the form ``"© {text}"``.
+        """
+        if text.startswith(cls._COPYRIGHT_SYMBOL):
+            return text
+        return f"{cls._COPYRIGHT_SYMBOL} {text}"
+
+    def load(
+        self,
+        max_resolution: int | None = None,
+        data: bytes | None = None,
+    ) -> None:
+        """
+        Opens the source image from ``file_path`` and prepares it for compositing.
+
+        RGB and RGBA images are kept in their native mode, since the watermark
+        is blended on an RGBA crop of the pill region only and an RGB source
+        (e.g. a JPEG photo) never needs a full-image alpha channel. All other
+        modes (e.g. L, P, CMYK) are converted to RGBA so a consistent colour
+        model is present before compositing.
+
+        When ``max_resolution`` is given and the source is an RGB JPEG, the
+        decoder is put into draft mode so libjpeg decodes directly at the
+        smallest 1/2, 1/4, or 1/8 scale that still covers ``max_resolution``.
+        ``export()`` then only has to finish the downscale from that reduced
+        size. Other formats are always decoded at full resolution.
+
+        Args:
+            max_resolution (int | None): Output size the image will later be
+                downscaled to, used only as a JPEG decode hint. Defaults to
+                ``None`` (decode at full resolution).
+            data (bytes | None): Encoded image bytes to decode instead of
+                reading ``file_path``, for callers that do their own file
+                I/O. Defaults to ``None``.
 
         Raises:
             IOError: If the file cannot be opened or is not a valid image format.
         """
         try:
-            self.image = Image.open(self.file_path).convert("RGBA")
+            image = Image.open(self.file_path if data is None else io.BytesIO(data))
+            if max_resolution and image.format == "JPEG" and image.mode == "RGB":
+                # Request the aspect-correct target size; a square box would
+                # let the shorter side cap the scale factor.
+                scale = min(1.0, max_resolution / max(image.size))
+                image.draft(
+                    "RGB",
+                    (math.ceil(image.width * scale), math.ceil(image.height * scale)),
+                )
+            if image.mode in self._NATIVE_MODES:
+                image.load()
+            else:
+                image = image.convert("RGBA")
+            self.image = image
         except Exception as e:
             raise IOError(f"Failed to open image: {e}")
 
@@ -131,9 +228,18 @@ class WatermarkProcessor:
               ``self.opacity`` so a single parameter controls the overall
               watermark intensity.
 
-        The watermark layer is composited onto ``self.image`` using
-        ``Image.alpha_composite`` and the result is stored in
-        ``self.watermarked``.
+        Only the watermark's bounding box is rendered and blended: the pill
+        and text are drawn into a tile covering the pill plus any glyph ink
+        that overhangs it (e.g. descenders of ``J`` or ``)`` reaching into
+        the margin), and the tile is composited onto the matching region of
+        ``self.image`` in place with Pillow's offset ``alpha_composite``
+        (see ``_blend_region``). The rest of the canvas is never touched, so
+        the cost scales with the pill area rather than the full image size.
+        ``self.watermarked`` refers to the composited image afterwards.
+
+        The tile depends only on the text, font size, wrap width, and colours,
+        so it is cached (see ``_render_pill_tile``). A batch that applies the
+        same text to images of the same width renders the pill only once.
 
         Raises:
             RuntimeError: If ``load()`` has not been called beforehand.
@@ -141,50 +247,155 @@ class WatermarkProcessor:
         if not self.image:
             raise RuntimeError("Image not loaded. Call load() first.")
 
-        layer = Image.new("RGBA", self.image.size, (0, 0, 0, 0))
-        draw = ImageDraw.Draw(layer)
-        font = self._load_font(
-            size=max(self._MIN_FONT_SIZE, self.image.width // self._FONT_DIVISOR)
-        )
-
+        font_size = max(self._MIN_FONT_SIZE, self.image.width // self._FONT_DIVISOR)
         max_text_width = self.image.width - (self._MARGIN + self._PADDING) * 2
-        lines = self._wrap_text(self.watermark_text, font, max_text_width, draw)
+        tile, (anchor_x, anchor_y) = self._render_pill_tile(
+            self.watermark_text,
+            font_size,
+            max_text_width,
+            self._bg_rgba,
+            self._text_rgba,
+        )
 
-        line_height = self._line_height(font, draw)
-        total_text_h = (
-            line_height * len(lines)
-            + self._LINE_SPACING * (len(lines) - 1)
+        # Place the tile so the pill's bottom-left corner sits ``_MARGIN`` px
+        # from the canvas corner.
+        tile_x0 = self._MARGIN - anchor_x
+        tile_y0 = self.image.height - self._MARGIN - anchor_y
+
+        # Clip to the canvas in case a long unbreakable word or many wrapped
+        # lines push the pill past the image edges.
+        box = (
+            max(tile_x0, 0),
+            max(tile_y0, 0),
+            min(tile_x0 + tile.width, self.image.width),
+            min(tile_y0 + tile.height, self.image.height),
         )
-        widest_line_w = max(
-            draw.textlength(line, font=font) for line in lines
+        tile = tile.crop(
+            (box[0] - tile_x0, box[1] - tile_y0, box[2] - tile_x0, box[3] - tile_y0)
         )
+        self._blend_region(tile, box)
+        self.watermarked = self.image
+
+    @classmethod
+    @lru_cache(maxsize=32)
+    def _render_pill_tile(
+        cls,
+        text: str,
+        font_size: int,
+        max_text_width: int,
+        bg_rgba: tuple[int, int, int, int],
+        text_rgba: tuple[int, int, int, int],
+    ) -> tuple[Image.Image, tuple[int, int]]:
+        """
+        Render the watermark pill (background and wrapped text) into an RGBA tile.
 
-        bg_alpha = int(180 * self.opacity)
-        text_alpha = int(255 * self.opacity)
+        The pill is sized from the line widths and the ``"Ag"`` block height
+        (see ``_text_block_height``), but glyph ink can extend past it, so
+        the tile is grown to the union of the pill and the text's actual
+        ``multiline_textbbox``.
 
-        pill_x0 = self._MARGIN
-        pill_y0 = self.image.height - total_text_h - (self._PADDING * 2) - self._MARGIN
-        pill_x1 = pill_x0 + int(widest_line_w) + (self._PADDING * 2)
-        pill_y1 = pill_y0 + total_text_h + (self._PADDING * 2)
+        Results are memoised on the arguments, so callers must treat the
+        returned image as read-only.
+
+        Args:
+            text (str): Watermark text, already prefixed with ``©``.
+            font_size (int): Font size passed to ``_load_font``.
+            max_text_width (int): Maximum rendered line width in pixels
+                before the text is wrapped.
+            bg_rgba (tuple[int, int, int, int]): Pill background colour.
+            text_rgba (tuple[int, int, int, int]): Text colour.
 
+        Returns:
+            tuple[Image.Image, tuple[int, int]]: The tile, and the position
+                of the pill's bottom-left corner within it.
+        """
+        font = cls._load_font(size=font_size)
+        measure = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+        lines, line_widths = cls._wrap_text(text, font, max_text_width, measure)
+        block = "\n".join(lines)
+
+        pill_w = int(max(line_widths)) + (cls._PADDING * 2)
+        pill_h = cls._text_block_height(font_size, len(lines)) + (cls._PADDING * 2)
+
+        # Ink bounds relative to the pill's top-left corner; may be negative
+        # or exceed the pill where glyphs overhang.
+        ink_x0, ink_y0, ink_x1, ink_y1 = measure.multiline_textbbox(
+            (cls._PADDING, cls._PADDING),
+            block,
+            font=font,
+            spacing=cls._LINE_SPACING,
+        )
+        offset_x = max(0, -math.floor(ink_x0))
+        offset_y = max(0, -math.floor(ink_y0))
+        tile_w = max(pill_w + 1, math.ceil(ink_x1)) + offset_x
+        tile_h = max(pill_h + 1, math.ceil(ink_y1)) + offset_y
+
+        tile = Image.new("RGBA", (tile_w, tile_h), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(tile)
         draw.rounded_rectangle(
-            [pill_x0, pill_y0, pill_x1, pill_y1],
-            radius=self._CORNER_RADIUS,
-            fill=(*self._BACKGROUND_COLOR, bg_alpha),
+            [offset_x, offset_y, offset_x + pill_w, offset_y + pill_h],
+            radius=cls._CORNER_RADIUS,
+            fill=bg_rgba,
+        )
+
+        draw.multiline_text(
+            (offset_x + cls._PADDING, offset_y + cls._PADDING),
+            block,
+            fill=text_rgba,
+            font=font,
+            spacing=cls._LINE_SPACING,
         )
 
-        text_x = pill_x0 + self._PADDING
-        text_y = pill_y0 + self._PADDING
-        for line in lines:
-            draw.text(
-                (text_x, text_y),
-                line,
-                fill=(*self._TEXT_COLOR, text_alpha),
-                font=font,
-            )
-            text_y += line_height + self._LINE_SPACING
+        return tile, (offset_x, offset_y + pill_h)
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _text_block_height(cls, font_size: int, line_count: int) -> int:
+        """
+        Return the pixel height of ``line_count`` lines drawn with
+        ``multiline_text`` at ``font_size``.
+
+        Measured on a representative ``"Ag"`` line to capture ascenders and
+        descenders consistently, so the result depends only on the font size
+        and line count and can be cached across images.
+
+        Args:
+            font_size (int): Font size passed to ``_load_font``.
+            line_count (int): Number of wrapped lines.
+
+        Returns:
+            int: Height of the text block in pixels.
+        """
+        measure = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+        _, top, _, bottom = measure.multiline_textbbox(
+            (0, 0),
+            "\n".join(["Ag"] * line_count),
+            font=cls._load_font(size=font_size),
+            spacing=cls._LINE_SPACING,
+        )
+        return int(bottom - top)
+
+    def _blend_region(self, tile: Image.Image, box: tuple[int, int, int, int]) -> None:
+        """
+        Composite an RGBA ``tile`` over the ``box`` region of ``self.image``.
+
+        RGBA images are composited in place with Pillow's offset form of
+        ``Image.alpha_composite``, so no full-canvas layer is ever allocated.
+        Other modes have only the ``box`` crop promoted to RGBA, composited,
+        and pasted back in the image's own mode.
+
+        Args:
+            tile (Image.Image): RGBA overlay whose size matches ``box``.
+            box (tuple[int, int, int, int]): ``(left, upper, right, lower)``
+                region of ``self.image`` to blend onto.
+        """
+        if self.image.mode == "RGBA":
+            self.image.alpha_composite(tile, dest=box[:2])
+            return
 
-        self.watermarked = Image.alpha_composite(self.image, layer)
+        region = self.image.crop(box).convert("RGBA")
+        region.alpha_composite(tile)
+        self.image.paste(region.convert(self.image.mode), box)
 
     def export(
         self,
@@ -196,25 +407,92 @@ class WatermarkProcessor:
         Saves the watermarked image to disk at the specified path.
 
         The output directory is created automatically if it does not exist.
-        When ``max_resolution`` is set, ``Image.thumbnail`` is used to
-        downscale the image so that neither dimension exceeds the given value
-        while preserving the original aspect ratio. Images smaller than
-        ``max_resolution`` are never upscaled.
+        When ``max_resolution`` is set, the target size is computed from the
+        aspect ratio and the image is downscaled with a single ``resize`` call
+        so that neither dimension exceeds the given value. The full-resolution
+        image is never copied, and images smaller than ``max_resolution`` are
+        never upscaled.
 
-        Because JPEG does not support an alpha channel, images saved in JPEG
-        format are automatically converted from RGBA to RGB before writing.
-        All other formats retain the alpha channel.
+        Because JPEG does not support an alpha channel, RGBA images saved in
+        JPEG format are automatically converted to RGB before writing. All
+        other formats retain the mode of the loaded image.
+
+        PNG is encoded with ``compress_level=1`` from ``_SAVE_OPTIONS``,
+        several times faster than Pillow's default of 6 at the cost of
+        somewhat larger files on photographic content. Other formats,
+        including JPEG, use Pillow's default encoder settings.
 
         Args:
             output_path (str): Destination file path, including file name
                 and extension (e.g. ``"output/result.png"``).
             format (str): Pillow-compatible format string such as ``"png"``,
-                ``"jpeg"``, or ``"tiff"``. Case-insensitive. Defaults to
-                ``"png"``.
+                ``"jpeg"``, or ``"tiff"``. Case-insensitive, and ``"jpg"`` is
+                accepted as an alias for ``"jpeg"``. Defaults to ``"png"``.
             max_resolution (int | None): If provided, the image is downscaled
                 so its longest side does not exceed this value in pixels.
                 Defaults to ``None`` (no resizing).
 
+        Raises:
+            RuntimeError: If ``load()`` has not been called, or if
+                ``apply_text_watermark()`` has not been called.
+        """
+        output, save_format = self._prepare_output(format, max_resolution)
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        output.save(
+            output_path,
+            format=save_format.upper(),
+            **self._SAVE_OPTIONS.get(save_format, {}),
+        )
+
+    def to_bytes(
+        self,
+        format: str = "png",
+        max_resolution: int | None = None,
+    ) -> bytes:
+        """
+        Encode the watermarked image in memory instead of writing it to disk.
+
+        Applies the same resizing, mode conversion, and encoder settings as
+        ``export()``.
+
+        Args:
+            format (str): Output format, as for ``export()``. Defaults to
+                ``"png"``.
+            max_resolution (int | None): Maximum output dimension, as for
+                ``export()``. Defaults to ``None`` (no resizing).
+
+        Returns:
+            bytes: The encoded image.
+
+        Raises:
+            RuntimeError: If ``load()`` has not been called, or if
+                ``apply_text_watermark()`` has not been called.
+        """
+        output, save_format = self._prepare_output(format, max_resolution)
+        buffer = io.BytesIO()
+        output.save(
+            buffer,
+            format=save_format.upper(),
+            **self._SAVE_OPTIONS.get(save_format, {}),
+        )
+        return buffer.getvalue()
+
+    def _prepare_output(
+        self,
+        format: str,
+        max_resolution: int | None,
+    ) -> tuple[Image.Image, str]:
+        """
+        Downscale and convert the watermarked image ready for encoding.
+
+        Args:
+            format (str): Requested output format; ``"jpg"`` maps to ``"jpeg"``.
+            max_resolution (int | None): Maximum output dimension in pixels.
+
+        Returns:
+            tuple[Image.Image, str]: The image to encode and the normalised
+                lowercase Pillow format name.
+
         Raises:
             RuntimeError: If ``load()`` has not been called, or if
                 ``apply_text_watermark()`` has not been called.
@@ -225,19 +503,25 @@ class WatermarkProcessor:
             raise RuntimeError("Watermark not applied. Call apply_text_watermark() first.")
 
         output = self.watermarked
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
 
         if max_resolution:
-            output = output.copy()
-            output.thumbnail(
-                (max_resolution, max_resolution),
-                resample=Image.LANCZOS,
-            )
-
-        if format.lower() in ("jpg", "jpeg"):
+            width, height = output.size
+            scale = min(1.0, max_resolution / max(width, height))
+            if scale < 1.0:
+                output = output.resize(
+                    (max(1, round(width * scale)), max(1, round(height * scale))),
+                    resample=Image.Resampling.LANCZOS,
+                    reducing_gap=2.0,
+                )
+
+        save_format = format.lower()
+        if save_format == "jpg":
+            save_format = "jpeg"
+
+        if save_format == "jpeg" and output.mode != "RGB":
             output = output.convert("RGB")
 
-        output.save(output_path, format=format.upper())
+        return output, save_format
 
     @staticmethod
     def _wrap_text(
@@ -245,7 +529,7 @@ class WatermarkProcessor:
         font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
         max_width: int,
         draw: ImageDraw.ImageDraw,
-    ) -> list[str]:
+    ) -> tuple[list[str], list[float]]:
         """
         Word-wrap ``text`` so no rendered line exceeds ``max_width`` pixels.
 
@@ -255,6 +539,13 @@ class WatermarkProcessor:
         ``max_width`` is placed on its own line without splitting — it will
         overflow slightly rather than break mid-word.
 
+        Text that already fits is returned as a single line after one
+        measurement, which is the common case for typical watermark strings
+        at photo resolutions. Otherwise each word and the inter-word space
+        are measured once and line widths are accumulated as a running total,
+        so the number of text-measurement calls grows linearly with the word
+        count rather than re-measuring the whole candidate line for every word.
+
         Args:
             text (str): The full watermark string to wrap.
             font: The font used to measure rendered text widths.
@@ -262,56 +553,53 @@ class WatermarkProcessor:
             draw (ImageDraw.ImageDraw): Draw context used for text measurement.
 
         Returns:
-            list[str]: Ordered list of wrapped lines ready for rendering.
+            tuple[list[str], list[float]]: Ordered list of wrapped lines ready
+                for rendering, and the rendered width of each line in pixels
+                so callers can size the text block without measuring again.
         """
+        if "\n" not in text:
+            text_w = draw.textlength(text, font=font)
+            if text_w <= max_width:
+                return [text], [text_w]
+
         words = text.split()
-        lines: list[str] = []
-        current = ""
+        widths = [draw.textlength(word, font=font) for word in words]
+        space_w = draw.textlength(" ", font=font)
 
-        for word in words:
-            candidate = f"{current} {word}".strip()
-            if draw.textlength(candidate, font=font) <= max_width:
-                current = candidate
+        lines: list[str] = []
+        line_widths: list[float] = []
+        current: list[str] = []
+        current_w = 0.0
+
+        for word, word_w in zip(words, widths):
+            candidate_w = current_w + (space_w if current else 0) + word_w
+            if candidate_w <= max_width:
+                current.append(word)
+                current_w = candidate_w
             else:
                 if current:
-                    lines.append(current)
-                current = word
+                    lines.append(" ".join(current))
+                    line_widths.append(current_w)
+                current = [word]
+                current_w = word_w
 
         if current:
-            lines.append(current)
-
-        return lines
-
-    @staticmethod
-    def _line_height(
-        font: ImageFont.FreeTypeFont | ImageFont.ImageFont,
-        draw: ImageDraw.ImageDraw,
-    ) -> int:
-        """
-        Return the rendered pixel height of a single line of text.
-
-        Uses a representative uppercase string to capture ascenders and
-        descenders consistently across different font sizes.
-
-        Args:
-            font: The font to measure.
-            draw (ImageDraw.ImageDraw): Draw context used for measurement.
+            lines.append(" ".join(current))
+            line_widths.append(current_w)
 
-        Returns:
-            int: Line height in pixels.
-        """
-        bbox = font.getbbox("Ag")
-        return bbox[3] - bbox[1]
+        return lines, line_widths
 
     @staticmethod
     def _load_font(size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
         """
         Attempts to load a bold TrueType font at the given point size.
 
-        Walks a list of common system font paths for Linux, macOS, and Windows.
-        Returns the first font found as a ``FreeTypeFont``. Falls back to
-        Pillow's built-in bitmap font if no system font is available, which
-        ignores the ``size`` argument and renders at a fixed small size.
+        The first available font from a list of common system font paths for
+        Linux, macOS, and Windows is resolved once at import time, and parsed
+        fonts are cached by size so images of the same width within a batch
+        share a single ``FreeTypeFont``. Falls back to Pillow's built-in bitmap
+        font if no system font is available, which ignores the ``size``
+        argument and renders at a fixed small size.
 
         Args:
             size (int): Desired font size in points for TrueType fonts.
@@ -320,12 +608,6 @@ class WatermarkProcessor:
             ImageFont.FreeTypeFont | ImageFont.ImageFont: A loaded font object
                 ready for use with ``ImageDraw.text()``.
         """
-        candidates = [
-            "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
-            "/Library/Fonts/Arial Bold.ttf",
-            "C:/Windows/Fonts/arialbd.ttf",
-        ]
-        for path in candidates:
-            if os.path.exists(path):
-                return ImageFont.truetype(path, size)
+        if _FONT_PATH:
+            return _cached_font(_FONT_PATH, size)
         return ImageFont.load_default()
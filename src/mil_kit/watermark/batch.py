@@ -3,18 +3,163 @@ Batch Processing Module for Image Watermarking.
 Manages parallel watermarking of images with enhanced error handling and logging.
 """
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Generator, Optional, Tuple, List
+from typing import Callable, Deque, Dict, Generator, Iterator, Optional, Set, Tuple, List
 from datetime import datetime
+from enum import IntEnum
+from itertools import chain, count, islice
 import logging
+import os
+import queue
 import shutil
+import time
 
 from tqdm import tqdm
 from mil_kit.watermark.add import WatermarkProcessor
 from mil_kit.watermark.meta import MetadataParser
 
 
+class Status(IntEnum):
+    """Outcome of processing a single file in a ``WatermarkJob``."""
+
+    OK = 0
+    SKIP = 1
+    NOMETA = 2
+    FAIL = 3
+
+
+# (status, source path, detail). The detail is the watermark text for OK,
+# the failure description for FAIL, and None otherwise.
+Result = Tuple[Status, Path, Optional[str]]
+
+
+def _watermark_bytes(
+    data: bytes,
+    image_path: Path,
+    watermark_text: str,
+    opacity: float,
+    output_format: str,
+    max_resolution: Optional[int],
+) -> bytes:
+    """
+    Watermark an encoded image in memory and return the encoded result.
+
+    This is the pure-CPU stage of the pipeline (decode, composite, encode).
+    It does no file I/O and takes only picklable arguments, so it can run in
+    a ``ProcessPoolExecutor`` without sending the job itself (logger,
+    metadata) to the worker processes.
+
+    Args:
+        data (bytes): Encoded source image.
+        image_path (Path): Source image path, used for error messages only.
+        watermark_text (str): Watermark text, already prefixed with ``©``.
+        opacity (float): Watermark opacity between 0.0 and 1.0.
+        output_format (str): Output image format (e.g. ``"png"``).
+        max_resolution (int | None): Maximum output image dimension in pixels.
+
+    Returns:
+        bytes: The watermarked image encoded in ``output_format``.
+    """
+    processor = WatermarkProcessor(
+        file_path=image_path,
+        watermark_text=watermark_text,
+        opacity=opacity,
+        prepend_copyright=False,
+    )
+    processor.load(max_resolution=max_resolution, data=data)
+    processor.apply_text_watermark()
+    return processor.to_bytes(format=output_format, max_resolution=max_resolution)
+
+
+# Distinguishes concurrent ``_write_atomic`` calls within one process.
+_PART_IDS = count()
+
+
+def _write_atomic(dest_path: Path, data: bytes) -> None:
+    """
+    Write ``data`` to ``dest_path`` without ever leaving a partial file there.
+
+    The bytes go to a ``.part`` file in the same directory, which is then
+    renamed over ``dest_path`` with ``os.replace`` (atomic on POSIX and
+    Windows). An interrupted run therefore never leaves a truncated image
+    that a later ``overwrite=False`` run would skip as already done. The
+    ``.part`` suffix is not an image extension, so leftovers are never
+    picked up as input.
+
+    Each call uses its own ``.part`` name (process id plus a counter), so
+    concurrent writes to the same destination, e.g. ``a.jpg`` and
+    ``a.png`` with ``overwrite=True``, never share or delete each other's
+    temporary file; the last rename wins. The file is created normally,
+    so the output gets the usual umask-based permissions.
+
+    Args:
+        dest_path (Path): Final output path.
+        data (bytes): Encoded image to write.
+    """
+    part_path = dest_path.with_name(
+        f"{dest_path.name}.{os.getpid()}-{next(_PART_IDS)}.part"
+    )
+    try:
+        part_path.write_bytes(data)
+        os.replace(part_path, dest_path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
+
+def _failure_detail(error: BaseException) -> str:
+    """Describe why a file failed, for the ``Status.FAIL`` result detail."""
+    if isinstance(error, FileNotFoundError):
+        return f"File not found - {error}"
+    if isinstance(error, PermissionError):
+        return f"Permission denied - {error}"
+    if isinstance(error, BrokenProcessPool):
+        return f"Worker process died - {error}"
+    return f"Processing failed - {error}"
+
+
+def _watermark_file(
+    image_path: Path,
+    dest_path: Path,
+    watermark_text: str,
+    opacity: float,
+    output_format: str,
+    max_resolution: Optional[int],
+) -> Result:
+    """
+    Read, watermark, and write a single image in the calling thread.
+
+    Args:
+        image_path (Path): Source image path.
+        dest_path (Path): Destination path for the watermarked image.
+        watermark_text (str): Watermark text, already prefixed with ``©``.
+        opacity (float): Watermark opacity between 0.0 and 1.0.
+        output_format (str): Output image format (e.g. ``"png"``).
+        max_resolution (int | None): Maximum output image dimension in pixels.
+
+    Returns:
+        Result: ``(Status.OK, image_path, watermark_text)`` on success or
+            ``(Status.FAIL, image_path, detail)`` on error.
+    """
+    try:
+        encoded = _watermark_bytes(
+            image_path.read_bytes(),
+            image_path,
+            watermark_text,
+            opacity,
+            output_format,
+            max_resolution,
+        )
+        _write_atomic(dest_path, encoded)
+    except Exception as e:
+        return Status.FAIL, image_path, _failure_detail(e)
+
+    return Status.OK, image_path, watermark_text
+
+
 class WatermarkJob:
     """
     Manages the batch watermarking of images in a directory with parallel execution.
@@ -35,7 +180,8 @@ class WatermarkJob:
     Features:
     - Metadata-driven per-file watermark text via ``MetadataParser``
     - Unmatched files copied to a ``no_metadata/`` directory for review
-    - Parallel processing using ThreadPoolExecutor
+    - Parallel processing: file I/O on a small thread pool, decode/composite/
+      encode on a ProcessPoolExecutor (threads for small batches)
     - Progress tracking with tqdm
     - Detailed logging and error handling
     - Flexible output options
@@ -43,6 +189,19 @@ class WatermarkJob:
     """
 
     SUPPORTED_FORMATS = ["png", "jpg", "jpeg", "tiff", "bmp", "webp"]
+    _EXTENSIONS = frozenset(f".{ext}" for ext in SUPPORTED_FORMATS)
+    # Below this many files, worker process start-up costs more than it saves.
+    _MIN_PROCESS_BATCH = 4
+    # Reads and writes release the GIL, so a couple of threads keep up with
+    # the CPU pool.
+    _IO_WORKERS = 2
+    # Files admitted into the pipeline per CPU worker; bounds how many
+    # encoded images are held in memory at once.
+    _IN_FLIGHT_PER_WORKER = 2
+    # Verbose status lines are written in batches of this many lines, or
+    # after this many seconds, whichever comes first.
+    _LOG_FLUSH_LINES = 64
+    _LOG_FLUSH_SECONDS = 0.25
 
     def __init__(
         self,
@@ -97,6 +256,12 @@ class WatermarkJob:
 
         self.input_dir = Path(input_dir)
         self.watermark_text = watermark_text
+        # Prefix the fallback once so each processor can skip it.
+        self._prefixed_text = (
+            WatermarkProcessor.with_copyright(watermark_text)
+            if watermark_text
+            else None
+        )
         self.recursive = recursive
         self.output_format = output_format.lower()
         self.opacity = opacity
@@ -123,10 +288,36 @@ class WatermarkJob:
         self.output_dir = Path(output_dir) if output_dir else self.input_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Recursive jobs mirror the source tree unless output_dir is given
+        # as input_dir itself. Decided on the paths as passed, before the
+        # rewrite below can make them compare equal.
+        self._mirror_subdirs = self.recursive and self.output_dir != self.input_dir
+
+        # Discovery is streamed while outputs are written, so a recursive
+        # walk can reach an output_dir nested inside input_dir after this
+        # run has written to it. Express output_dir under input_dir so
+        # destination paths compare equal to discovered paths, and track
+        # them in _written_outputs so they are never picked up as inputs.
+        self._output_in_input = False
+        if self._mirror_subdirs:
+            try:
+                nested = self.output_dir.resolve().relative_to(
+                    self.input_dir.resolve()
+                )
+            except ValueError:
+                pass
+            else:
+                self.output_dir = self.input_dir / nested
+                self._output_in_input = True
+
         self.metadata: Optional[MetadataParser] = None
         if meta_file:
             self.metadata = MetadataParser(meta_file)
             self.metadata.parse()
+        else:
+            # Every file gets the same text, so skip the metadata branch
+            # on the per-file path entirely.
+            self._resolve_watermark_text = self._resolve_fallback_text
 
         self.stats = {
             "success": 0,
@@ -138,6 +329,11 @@ class WatermarkJob:
         }
         self.failed_files: List[Path] = []
         self.no_metadata_files: List[Path] = []
+        self._output_dirs: Dict[Path, Path] = {}
+        self._existing_outputs: Dict[Path, Set[str]] = {}
+        self._written_outputs: Set[Path] = set()
+        self._log_buffer: List[str] = []
+        self._log_flushed_at = 0.0
 
         self._setup_logging(log_file)
 
@@ -178,18 +374,23 @@ class WatermarkJob:
     def _print_settings(self) -> None:
         """Log the active configuration before processing begins."""
         self.logger.info("Watermark Job Settings:")
-        self.logger.info(f"  Input Directory:  {self.input_dir}")
-        self.logger.info(f"  Output Directory: {self.output_dir}")
-        self.logger.info(f"  Metadata File:    {self.metadata.file_path if self.metadata else 'None'}")
-        self.logger.info(f"  Fallback Text:    {self.watermark_text or 'None'}")
-        self.logger.info(f"  Opacity:          {self.opacity}")
-        self.logger.info(f"  Recursive:        {self.recursive}")
-        self.logger.info(f"  Output Format:    {self.output_format}")
-        self.logger.info(f"  Max Workers:      {self.max_workers or 'Auto (CPU count)'}")
-        self.logger.info(f"  Max Resolution:   {self.max_resolution or 'No limit'}")
-        self.logger.info(f"  Limit:            {self.limit or 'No limit'}")
-        self.logger.info(f"  Overwrite:        {self.overwrite}")
-        self.logger.info(f"  Verbose:          {self.verbose}")
+        self.logger.info("  Input Directory:  %s", self.input_dir)
+        self.logger.info("  Output Directory: %s", self.output_dir)
+        self.logger.info(
+            "  Metadata File:    %s",
+            self.metadata.file_path if self.metadata else "None",
+        )
+        self.logger.info("  Fallback Text:    %s", self.watermark_text or "None")
+        self.logger.info("  Opacity:          %s", self.opacity)
+        self.logger.info("  Recursive:        %s", self.recursive)
+        self.logger.info("  Output Format:    %s", self.output_format)
+        self.logger.info(
+            "  Max Workers:      %s", self.max_workers or "Auto (CPU count)"
+        )
+        self.logger.info("  Max Resolution:   %s", self.max_resolution or "No limit")
+        self.logger.info("  Limit:            %s", self.limit or "No limit")
+        self.logger.info("  Overwrite:        %s", self.overwrite)
+        self.logger.info("  Verbose:          %s", self.verbose)
         self.logger.info("")
 
     def run(self) -> dict:
@@ -200,7 +401,12 @@ class WatermarkJob:
         watermark text for each via metadata or fallback, and writes results
         to ``output_dir``. Files with no metadata match and no fallback text
         are copied to ``output_dir/no_metadata/`` for manual review. A single
-        file skips the thread pool to avoid unnecessary overhead.
+        file skips the worker pools to avoid unnecessary overhead.
+
+        Discovery is streamed: only the first ``_MIN_PROCESS_BATCH`` files
+        are read ahead to choose an execution strategy, and the rest of the
+        directory walk feeds the pipeline as it runs, so workers start before
+        the walk of a large tree has finished.
 
         Returns:
             dict: Processing statistics with keys ``success``, ``failed``,
@@ -209,25 +415,30 @@ class WatermarkJob:
         self.stats["start_time"] = datetime.now()
         self._print_settings()
 
-        files = list(self._get_files())
+        files: Iterator[Path] = self._get_files()
         if self.limit is not None:
-            files = files[: self.limit]
+            files = islice(files, self.limit)
 
-        total_files = len(files)
+        head = list(islice(files, self._MIN_PROCESS_BATCH))
 
-        if total_files == 0:
-            message = f"No supported image files found in {self.input_dir}"
-            if self.recursive:
-                message += " (including subdirectories)"
-            self.logger.warning(message)
+        if not head:
+            self.logger.warning(
+                "No supported image files found in %s%s",
+                self.input_dir,
+                " (including subdirectories)" if self.recursive else "",
+            )
             return self.stats
 
-        self.logger.info(f"Found {total_files} image file(s) in {self.input_dir}")
-
-        if total_files == 1:
-            self._process_single_file_wrapper(files[0])
+        if len(head) == 1:
+            self.logger.info("Found 1 image file in %s", self.input_dir)
+            self._process_single_file_wrapper(head[0])
+            total_files = 1
         else:
-            self._process_multiple_files(files, total_files)
+            self.logger.info("Processing image files from %s", self.input_dir)
+            total_files = self._process_multiple_files(
+                chain(head, files),
+                use_processes=len(head) >= self._MIN_PROCESS_BATCH,
+            )
 
         self.stats["end_time"] = datetime.now()
         self._print_summary(total_files)
@@ -239,58 +450,250 @@ class WatermarkJob:
 
         return self.stats
 
-    def _process_multiple_files(self, files: List[Path], total_files: int) -> None:
+    def _process_multiple_files(
+        self, files: Iterator[Path], use_processes: bool
+    ) -> int:
         """
-        Submit all image files to a thread pool and collect results as they complete.
+        Run all image files through a split I/O / CPU pipeline.
+
+        Each file passes through three stages:
+
+        1. read — ``Path.read_bytes`` on a small I/O thread pool
+        2. watermark — ``_watermark_bytes`` on a CPU pool, which receives the
+           encoded source bytes and returns the encoded result
+        3. write — ``_write_atomic`` back on the I/O thread pool
+
+        File I/O releases the GIL, so it stays on threads in this process,
+        while the GIL-bound decode/composite/encode runs in a
+        ``ProcessPoolExecutor`` whose workers never touch the filesystem.
+        Small batches (``use_processes=False``) use a thread pool for the
+        CPU stage to avoid process start-up overhead.
+
+        The calling thread is the only scheduler: completed futures post an
+        event onto a queue, and this loop submits the next stage, records
+        results, and admits new files. ``files`` is consumed lazily, and at
+        most ``_IN_FLIGHT_PER_WORKER`` files per CPU worker are in the
+        pipeline at once, which bounds memory and keeps both the directory
+        walk and the reads from running far ahead of the CPU pool.
+
+        If a worker process dies (for example an OOM kill or a crash inside
+        a decoder), new files continue on a fresh process pool, and each file
+        that was in the broken pool is retried once, one at a time, on a
+        separate single-worker pool. Only a file that breaks that pool as
+        well is recorded as failed, so one bad file neither aborts the batch
+        nor takes the files processed alongside it down with it.
 
         Args:
-            files (List[Path]): Image paths to process.
-            total_files (int): Total count used for the tqdm progress bar.
-        """
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            futures = {
-                executor.submit(self._process_single_file, path): path
-                for path in files
-            }
-
-            with tqdm(
-                total=total_files,
-                desc="Watermarking images",
-                unit="file",
-                disable=not self.verbose,
-            ) as pbar:
-                for future in as_completed(futures):
-                    image_path = futures[future]
-                    try:
-                        success, message = future.result()
-                        self._update_stats(success, image_path if not success else None)
-                        if self.verbose:
-                            tqdm.write(message)
-                    except Exception as e:
-                        self._update_stats(False, image_path)
-                        error_msg = f"✗ {image_path.name}: Unexpected error - {e}"
-                        if self.verbose:
-                            tqdm.write(error_msg)
-                        self.logger.error(error_msg)
+            files (Iterator[Path]): Image paths to process, typically a live
+                directory walk.
+            use_processes (bool): Run the CPU stage in worker processes
+                rather than threads.
 
+        Returns:
+            int: Number of files processed.
+        """
+        cpu_executor_cls = (
+            ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        )
+        cpu_workers = self.max_workers or os.cpu_count() or 1
+        max_in_flight = cpu_workers * self._IN_FLIGHT_PER_WORKER
+
+        events: queue.Queue = queue.Queue()
+        in_flight = 0
+        processed = 0
+
+        # Encoded sources held while a file is in the CPU stage, so a file
+        # caught in a broken process pool can be retried without re-reading.
+        cpu_inputs: Dict[Path, bytes] = {}
+        # Files to retry after a pool broke, run one at a time on a
+        # single-worker pool so a second crash is attributed to that file.
+        retry_queue: Deque[Tuple[tuple, bytes]] = deque()
+        retried: Set[Path] = set()
+        retry_busy = False
+        retry_pool: Optional[ProcessPoolExecutor] = None
+
+        def notify(stage: str, task: tuple) -> Callable[[Future], None]:
+            return lambda future: events.put((stage, task, future))
+
+        def submit_cpu(task: tuple) -> None:
+            nonlocal cpu_pool
+            cpu_pool, future = self._submit_watermark(
+                cpu_pool,
+                lambda: cpu_executor_cls(max_workers=self.max_workers),
+                cpu_inputs[task[0]],
+                task,
+            )
+            future.add_done_callback(notify("watermark", task))
+
+        def start_retry() -> None:
+            nonlocal retry_pool, retry_busy
+            if retry_busy or not retry_queue:
+                return
+            task, data = retry_queue.popleft()
+            retry_pool, future = self._submit_watermark(
+                retry_pool or ProcessPoolExecutor(max_workers=1),
+                lambda: ProcessPoolExecutor(max_workers=1),
+                data,
+                task,
+            )
+            future.add_done_callback(notify("watermark", task))
+            retry_busy = True
+
+        with ThreadPoolExecutor(
+            max_workers=self._IO_WORKERS
+        ) as io_pool, tqdm(
+            total=self.limit,
+            desc="Watermarking images",
+            unit="file",
+            disable=not self.verbose,
+        ) as pbar:
+
+            def admit() -> None:
+                nonlocal in_flight, processed
+                while in_flight < max_in_flight:
+                    path = next(files, None)
+                    if path is None:
+                        return
+                    processed += 1
+                    task, result = self._prepare_task(path)
+                    if task is None:
+                        self._handle_result(result)
+                        pbar.update(1)
+                        continue
+                    io_pool.submit(path.read_bytes).add_done_callback(
+                        notify("read", task)
+                    )
+                    in_flight += 1
+
+            cpu_pool = cpu_executor_cls(max_workers=self.max_workers)
+            try:
+                admit()
+                while in_flight:
+                    stage, task, future = events.get()
+                    image_path, dest_path, watermark_text = task[:3]
+
+                    error = future.exception()
+                    if error is None and stage == "read":
+                        cpu_inputs[image_path] = future.result()
+                        submit_cpu(task)
+                        continue
+                    if stage == "watermark":
+                        if image_path in retried:
+                            retry_busy = False
+                            start_retry()
+                        elif isinstance(error, BrokenProcessPool):
+                            # Likely an innocent bystander of another file's
+                            # crash; give it one isolated retry.
+                            retried.add(image_path)
+                            retry_queue.append((task, cpu_inputs.pop(image_path)))
+                            start_retry()
+                            continue
+                        else:
+                            del cpu_inputs[image_path]
+                    if error is None and stage == "watermark":
+                        io_pool.submit(
+                            _write_atomic, dest_path, future.result()
+                        ).add_done_callback(notify("write", task))
+                        continue
+
+                    if error is None:
+                        result = (Status.OK, image_path, watermark_text)
+                    else:
+                        result = (Status.FAIL, image_path, _failure_detail(error))
+
+                    in_flight -= 1
+                    self._handle_result(result)
                     pbar.update(1)
+                    admit()
+            finally:
+                cpu_pool.shutdown()
+                if retry_pool is not None:
+                    retry_pool.shutdown()
+
+            self._flush_log()
+
+        return processed
+
+    def _submit_watermark(
+        self,
+        pool: Executor,
+        make_pool: Callable[[], Executor],
+        data: bytes,
+        task: tuple,
+    ) -> Tuple[Executor, Future]:
+        """
+        Submit ``_watermark_bytes`` for ``task``, replacing a broken pool.
+
+        Futures already in a broken pool come back with ``BrokenProcessPool``
+        through their callbacks; this only handles the submit itself.
+
+        Args:
+            pool (Executor): Pool to submit to.
+            make_pool (Callable[[], Executor]): Builds a replacement pool.
+            data (bytes): Encoded source image.
+            task (tuple): Task built by ``_prepare_task``.
+
+        Returns:
+            Tuple[Executor, Future]: The pool that accepted the work, which
+                is new if ``pool`` was broken, and its future.
+        """
+        try:
+            return pool, pool.submit(_watermark_bytes, data, task[0], *task[2:])
+        except BrokenProcessPool:
+            self.logger.warning(
+                "A worker process terminated abruptly; restarting the worker pool."
+            )
+            pool.shutdown(wait=False)
+            pool = make_pool()
+            return pool, pool.submit(_watermark_bytes, data, task[0], *task[2:])
+
+    def _handle_result(self, result: Result) -> None:
+        """
+        Record the outcome of one file from the parallel path and report it.
+
+        The status line is only formatted when it will be printed, so
+        non-verbose runs build no per-file message strings. Lines are
+        buffered and written above the progress bar in batches, rather than
+        taking the ``tqdm.write`` lock and redrawing the bar for every file.
+
+        Args:
+            result (Result): Outcome of processing the file.
+        """
+        self._update_stats(result[0], result[1])
+        if not self.verbose:
+            return
+
+        self._log_buffer.append(self._format_message(*result))
+        if (
+            len(self._log_buffer) >= self._LOG_FLUSH_LINES
+            or time.monotonic() - self._log_flushed_at >= self._LOG_FLUSH_SECONDS
+        ):
+            self._flush_log()
+
+    def _flush_log(self) -> None:
+        """Write any buffered status lines above the progress bar."""
+        if self._log_buffer:
+            tqdm.write("\n".join(self._log_buffer))
+            self._log_buffer.clear()
+        self._log_flushed_at = time.monotonic()
 
     def _process_single_file_wrapper(self, image_path: Path) -> None:
         """
-        Process a single file outside the thread pool and log the result.
+        Process a single file outside the worker pools and log the result.
 
         Args:
             image_path (Path): Path to the image to process.
         """
         try:
-            success, message = self._process_single_file(image_path)
-            self._update_stats(success, image_path if not success else None)
-            self.logger.info(message)
+            result = self._process_single_file(image_path)
+            self._update_stats(result[0], image_path)
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(self._format_message(*result))
         except Exception as e:
-            self._update_stats(False, image_path)
-            self.logger.error(f"✗ {image_path.name}: Unexpected error - {e}")
+            self._update_stats(Status.FAIL, image_path)
+            self.logger.error("✗ %s: Unexpected error - %s", image_path.name, e)
 
-    def _process_single_file(self, image_path: Path) -> Tuple[bool, str]:
+    def _process_single_file(self, image_path: Path) -> Result:
         """
         Resolve watermark text then run the load → watermark → export pipeline.
 
@@ -298,60 +701,91 @@ class WatermarkJob:
 
         1. Metadata lookup by file stem (MIL number).
         2. Static fallback ``watermark_text``.
-        3. No metadata — the file is appended to ``no_metadata_files``,
-           its counter is incremented, and processing is skipped.
+        3. No metadata — a ``Status.NOMETA`` result is returned and
+           processing is skipped.
 
         Args:
             image_path (Path): Source image path.
 
         Returns:
-            Tuple[bool, str]: A ``(success, message)`` pair where ``success``
-                indicates whether the file was processed without error and
-                ``message`` is a human-readable status string.
+            Result: The outcome of processing the file.
         """
-        try:
-            watermark_text = self._resolve_watermark_text(image_path)
+        task, result = self._prepare_task(image_path)
+        if task is None:
+            return result
+        return _watermark_file(*task)
+
+    def _prepare_task(
+        self, image_path: Path
+    ) -> Tuple[Optional[tuple], Optional[Result]]:
+        """
+        Resolve everything about a file that needs the job's state.
 
-            if not watermark_text:
-                self.no_metadata_files.append(image_path)
-                self.stats["no_metadata"] += 1
-                return (
-                    False,
-                    f"? {image_path.name}: No metadata match for MIL# '{image_path.stem}' — queued for review",
-                )
+        Runs in the parent process: looks up the watermark text, derives the
+        destination path, and applies the overwrite check, which is skipped
+        entirely when ``overwrite`` is True. The file stem is
+        computed once here and passed down, since ``Path`` does not cache
+        it. Errors are returned as a failed result so one bad file never
+        aborts the batch.
 
-            dest_path = self._generate_output_path(image_path)
+        Args:
+            image_path (Path): Source image path.
 
-            if dest_path.exists() and not self.overwrite:
-                self.stats["skipped"] += 1
-                return (
-                    False,
-                    f"⊘ {image_path.name}: Skipped (output exists, overwrite=False)",
-                )
+        Returns:
+            Tuple[tuple | None, Result | None]: Either ``(task, None)`` where
+                ``task`` holds the arguments for ``_watermark_file``, or
+                ``(None, result)`` when the file is settled without
+                processing (no metadata, skipped, or failed).
+        """
+        try:
+            stem = image_path.stem
+            watermark_text = self._resolve_watermark_text(stem)
+            if not watermark_text:
+                return None, (Status.NOMETA, image_path, None)
 
-            processor = WatermarkProcessor(
-                file_path=image_path,
-                watermark_text=watermark_text,
-                opacity=self.opacity,
-            )
-            processor.load()
-            processor.apply_text_watermark()
-            processor.export(
-                output_path=str(dest_path),
-                format=self.output_format,
-                max_resolution=self.max_resolution,
-            )
+            dest_path = self._generate_output_path(image_path, stem)
+            if not self.overwrite and self._claim_output(dest_path):
+                return None, (Status.SKIP, image_path, None)
+        except Exception as e:
+            return None, (Status.FAIL, image_path, _failure_detail(e))
+
+        task = (
+            image_path,
+            dest_path,
+            watermark_text,
+            self.opacity,
+            self.output_format,
+            self.max_resolution,
+        )
+        if self._output_in_input:
+            self._written_outputs.add(dest_path)
+        return task, None
 
-            return True, f"✓ {image_path.name} [{watermark_text}] → {dest_path.name}"
+    def _format_message(
+        self, status: Status, image_path: Path, detail: Optional[str]
+    ) -> str:
+        """
+        Build the human-readable status line for one file's result.
 
-        except FileNotFoundError as e:
-            return False, f"✗ {image_path.name}: File not found - {e}"
-        except PermissionError as e:
-            return False, f"✗ {image_path.name}: Permission denied - {e}"
-        except Exception as e:
-            return False, f"✗ {image_path.name}: Processing failed - {e}"
+        Args:
+            status (Status): Outcome of processing the file.
+            image_path (Path): Source image path.
+            detail (str | None): Watermark text for ``Status.OK``, failure
+                description for ``Status.FAIL``.
 
-    def _resolve_watermark_text(self, image_path: Path) -> Optional[str]:
+        Returns:
+            str: The status line.
+        """
+        name = image_path.name
+        if status is Status.OK:
+            return f"✓ {name} [{detail}] → {image_path.stem}.{self.output_format}"
+        if status is Status.SKIP:
+            return f"⊘ {name}: Skipped (output exists, overwrite=False)"
+        if status is Status.NOMETA:
+            return f"? {name}: No metadata match for MIL# '{image_path.stem}' — queued for review"
+        return f"✗ {name}: {detail}"
+
+    def _resolve_watermark_text(self, stem: str) -> Optional[str]:
         """
         Determine the watermark text for a given image file.
 
@@ -360,84 +794,184 @@ class WatermarkJob:
         metadata record is found. Returns ``None`` if neither source yields
         a value, signalling that the file has no resolvable watermark.
 
+        The returned text is already prefixed with ``©``; the fallback is
+        prefixed once in ``__init__`` and shared by every file.
+
         Args:
-            image_path (Path): Source image whose stem is used as the lookup key.
+            stem (str): Source image file stem, used as the lookup key.
 
         Returns:
             str | None: Resolved watermark text, or ``None`` if unresolvable.
         """
         if self.metadata:
-            text = self.metadata.get_watermark_text(image_path.stem)
+            text = self.metadata.get_watermark_text(stem)
             if text:
-                return text
+                return WatermarkProcessor.with_copyright(text)
 
-        return self.watermark_text
+        return self._prefixed_text
 
-    def _update_stats(self, success: bool, failed_path: Optional[Path] = None) -> None:
+    def _resolve_fallback_text(self, stem: str) -> Optional[str]:
         """
-        Increment success or failure counters and record the failed path if applicable.
+        Return the prefixed fallback text for any file.
 
-        Files routed to ``no_metadata_files`` are tracked separately and do
-        not pass through this method — they are appended directly inside
-        ``_process_single_file`` to keep their handling self-contained.
+        Bound over ``_resolve_watermark_text`` in ``__init__`` when no
+        metadata file is configured.
 
         Args:
-            success (bool): Whether the file was processed successfully.
-            failed_path (Path | None): Path to record when ``success`` is False.
+            stem (str): Source image file stem (unused).
+
+        Returns:
+            str | None: The shared, ``©``-prefixed fallback text.
+        """
+        return self._prefixed_text
+
+    def _update_stats(self, status: Status, image_path: Path) -> None:
         """
-        if success:
+        Increment the counter for ``status`` and track files needing review.
+
+        Failed files are appended to ``failed_files`` and unmatched files to
+        ``no_metadata_files``, so both can be copied out after the job.
+
+        Args:
+            status (Status): Outcome of processing the file.
+            image_path (Path): Source image path.
+        """
+        if status is Status.OK:
             self.stats["success"] += 1
+        elif status is Status.SKIP:
+            self.stats["skipped"] += 1
+        elif status is Status.NOMETA:
+            self.stats["no_metadata"] += 1
+            self.no_metadata_files.append(image_path)
         else:
             self.stats["failed"] += 1
-            if failed_path:
-                self.failed_files.append(failed_path)
+            self.failed_files.append(image_path)
 
     def _get_files(self) -> Generator[Path, None, None]:
         """
         Yield all supported image files in ``input_dir``.
 
+        Walks the tree once with ``os.scandir`` and filters on the lowercased
+        file extension against the class-level ``_EXTENSIONS`` set, rather
+        than running a separate glob per supported format. The extension is
+        checked before the entry type, and ``DirEntry`` caches the type from
+        the directory listing, so no extra ``stat`` call is made per file.
+        On filesystems that do not report entry types, only image-named
+        entries (and, when recursive, candidate directories) are stat'ed.
+        Symlinked directories are not followed when ``recursive`` is True.
+        A directory that cannot be listed (e.g. ``PermissionError``) is
+        logged and skipped rather than aborting the run.
+
+        Files are yielded while the pipeline is already writing outputs, so
+        each directory's listing is read in full before any of its entries
+        are yielded. Outputs written into a directory after its listing was
+        taken are therefore never seen, which covers the default
+        ``output_dir == input_dir``. When a recursive walk reaches an
+        ``output_dir`` nested inside ``input_dir`` later on, files this run
+        wrote there are skipped via ``_written_outputs``.
+
         Yields:
-            Path: Absolute path to each discovered image file.
+            Path: Path to each discovered image file.
         """
-        extensions = {f"*.{ext}" for ext in self.SUPPORTED_FORMATS}
-        pattern_prefix = "**/" if self.recursive else ""
-        for ext_pattern in extensions:
-            for path in self.input_dir.glob(f"{pattern_prefix}{ext_pattern}"):
-                if path.is_file():
-                    yield path
-
-    def _generate_output_path(self, image_path: Path) -> Path:
+        extensions = self._EXTENSIONS
+        recursive = self.recursive
+        written = self._written_outputs if self._output_in_input else None
+
+        def walk(directory: str) -> Generator[Path, None, None]:
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError as e:
+                self.logger.warning("Skipping unreadable directory %s: %s", directory, e)
+                return
+            for entry in entries:
+                if (
+                    os.path.splitext(entry.name)[1].lower() in extensions
+                    and entry.is_file()
+                ):
+                    path = Path(entry.path)
+                    if written is None or path not in written:
+                        yield path
+                elif recursive and entry.is_dir(follow_symlinks=False):
+                    yield from walk(entry.path)
+
+        yield from walk(str(self.input_dir))
+
+    def _generate_output_path(self, image_path: Path, stem: str) -> Path:
         """
         Derive the output file path, preserving subdirectory structure when recursive.
 
-        When ``recursive=True`` and ``output_dir != input_dir``, the relative
+        When ``recursive=True`` and ``output_dir`` was given as a different
+        path from ``input_dir`` (see ``_mirror_subdirs``), the relative
         subdirectory of the source file is recreated under ``output_dir`` so
-        the original folder structure is mirrored in the output.
+        the original folder structure is mirrored in the output. The output
+        subdirectory for each source folder is resolved and created once and
+        remembered in ``_output_dirs``, so later files in the same folder skip
+        both ``relative_to`` and the ``mkdir`` call. This runs in the parent
+        process, so workers never create directories.
 
         Args:
             image_path (Path): Source image path.
+            stem (str): ``image_path.stem``, already computed by the caller.
 
         Returns:
             Path: Destination path including the converted file extension.
         """
-        if self.recursive and self.output_dir != self.input_dir:
-            relative_path = image_path.relative_to(self.input_dir)
-            output_subdir = self.output_dir / relative_path.parent
-            output_subdir.mkdir(parents=True, exist_ok=True)
-            return output_subdir / f"{image_path.stem}.{self.output_format}"
+        if self._mirror_subdirs:
+            source_dir = image_path.parent
+            output_subdir = self._output_dirs.get(source_dir)
+            if output_subdir is None:
+                output_subdir = self.output_dir / source_dir.relative_to(self.input_dir)
+                output_subdir.mkdir(parents=True, exist_ok=True)
+                self._output_dirs[source_dir] = output_subdir
+            return output_subdir / f"{stem}.{self.output_format}"
+
+        return self.output_dir / f"{stem}.{self.output_format}"
+
+    def _claim_output(self, dest_path: Path) -> bool:
+        """
+        Report whether ``dest_path`` is taken, and claim it if it is not.
+
+        Each output directory is listed once with ``os.scandir`` on first
+        use and its file names kept in ``_existing_outputs``, so the
+        overwrite check is a set lookup rather than a ``stat`` per file.
+        Claimed names are added to the set, so two sources that map to
+        the same output (e.g. ``a.jpg`` and ``a.png``) are written once.
+
+        Args:
+            dest_path (Path): Destination path of an output file.
 
-        return self.output_dir / f"{image_path.stem}.{self.output_format}"
+        Returns:
+            bool: True if the output already exists or was claimed earlier.
+        """
+        directory = dest_path.parent
+        names = self._existing_outputs.get(directory)
+        if names is None:
+            try:
+                with os.scandir(directory) as entries:
+                    names = {entry.name for entry in entries}
+            except FileNotFoundError:
+                names = set()
+            self._existing_outputs[directory] = names
+
+        name = dest_path.name
+        if name in names:
+            return True
+        names.add(name)
+        return False
 
     def _copy_failed_files(self) -> None:
         """
         Copy all processing-error files to a ``failed_files/`` subdirectory
         inside ``output_dir`` for manual inspection after the job completes.
+
+        Files are hard-linked where possible (see ``_link_or_copy``).
         """
         failed_dir = self.output_dir / "failed_files"
         failed_dir.mkdir(parents=True, exist_ok=True)
-        self.logger.info(f"Copying failed files to {failed_dir} for review.")
+        self.logger.info("Copying failed files to %s for review.", failed_dir)
         for file in self.failed_files:
-            shutil.copy(file, failed_dir)
+            self._link_or_copy(file, failed_dir)
 
     def _copy_no_metadata_files(self) -> None:
         """
@@ -448,19 +982,67 @@ class WatermarkJob:
         in the metadata file and for which no fallback ``watermark_text`` was
         provided. Copying them here preserves the originals in a dedicated
         location for manual review or re-processing once metadata is available.
+        Files are hard-linked where possible (see ``_link_or_copy``).
         """
         no_meta_dir = self.output_dir / "no_metadata"
         no_meta_dir.mkdir(parents=True, exist_ok=True)
-        self.logger.info(f"Copying {len(self.no_metadata_files)} unmatched file(s) to {no_meta_dir} for review.")
+        self.logger.info(
+            "Copying %d unmatched file(s) to %s for review.",
+            len(self.no_metadata_files),
+            no_meta_dir,
+        )
         for file in self.no_metadata_files:
-            shutil.copy(file, no_meta_dir)
+            self._link_or_copy(file, no_meta_dir)
+
+    @staticmethod
+    def _link_or_copy(source: Path, dest_dir: Path) -> None:
+        """
+        Place ``source`` in ``dest_dir`` as a hard link, copying if linking fails.
+
+        A hard link costs a single syscall and no data transfer when
+        ``dest_dir`` is on the same filesystem as the source, which is the
+        common case. Across filesystems, or where links are not supported,
+        the contents are copied with ``shutil.copyfile``, which uses the
+        platform's in-kernel copy where available and skips the permission
+        copy done by ``shutil.copy``.
+
+        The link or copy is made under a ``.part`` name and then moved over
+        any existing file of the same name with ``os.replace``, so an
+        existing review copy is never removed before its replacement is in
+        place. If ``source`` already is ``dest`` (e.g. a recursive re-run
+        that discovers the review folder itself), nothing is done.
+
+        Since a hard link shares data with the source, editing the copy in
+        place also edits the original image.
+
+        Args:
+            source (Path): File to place in ``dest_dir``.
+            dest_dir (Path): Existing destination directory.
+        """
+        dest = dest_dir / source.name
+        if dest.exists() and os.path.samefile(source, dest):
+            return
+
+        part = dest.with_name(dest.name + ".part")
+        part.unlink(missing_ok=True)
+        try:
+            try:
+                os.link(source, part)
+            except OSError:
+                shutil.copyfile(source, part)
+            os.replace(part, dest)
+        except BaseException:
+            part.unlink(missing_ok=True)
+            raise
 
     def _print_summary(self, total_files: int) -> None:
         """
         Print a formatted summary table after all files have been processed.
 
         Args:
-            total_files (int): Total number of files discovered before processing.
+            total_files (int): Number of files processed, including skipped,
+                unmatched, and failed files. Discovery is streamed, so this
+                is only known once the run has finished.
         """
         duration = self.stats["end_time"] - self.stats["start_time"]
 
@@ -487,6 +1069,8 @@ class WatermarkJob:
                 print(f"  - {f}")
 
         self.logger.info(
-            f"Watermark job completed: {self.stats['success']}/{total_files} successful, "
-            f"{self.stats['no_metadata']} unmatched"
+            "Watermark job completed: %d/%d successful, %d unmatched",
+            self.stats["success"],
+            total_files,
+            self.stats["no_metadata"],
         )
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict
-
-import polars as pl
+from typing import Dict, List, Optional, Sequence, Tuple
+import csv
 
 
 class MetadataParser:
@@ -11,9 +10,10 @@ class MetadataParser:
     Parses image metadata from an Excel or CSV file and builds a lookup
     table mapping MIL numbers to formatted watermark strings.
 
-    Only two columns are retained from the source file regardless of how
+    Only two columns are kept from the source file regardless of how
     many columns are present: the MIL number column and the Photographer
-    column. All other columns are discarded after loading.
+    column. Excel files load just those two columns; CSV rows are split
+    in full by the ``csv`` module, but only those two cells are kept.
 
     The watermark text for each record is formatted as::
 
@@ -96,40 +96,22 @@ class MetadataParser:
             IOError: If the file cannot be read or parsed.
         """
         try:
-            df = self._load_file()
+            pairs = self._load_file()
+        except KeyError:
+            raise
         except Exception as e:
             raise IOError(f"Failed to read metadata file: {e}")
 
-        df = df.rename({col: col.strip() for col in df.columns})
-
-        missing = [
-            col for col in (self.mil_col, self.photographer_col)
-            if col not in df.columns
-        ]
-        if missing:
-            raise KeyError(
-                f"Column(s) not found in metadata file: {missing}. "
-                f"Available columns: {df.columns}"
-            )
-
-        df = (
-            df
-            .select([self.mil_col, self.photographer_col])
-            .with_columns([
-                pl.col(self.mil_col).cast(pl.Utf8).str.strip_chars(),
-                pl.col(self.photographer_col).cast(pl.Utf8).str.strip_chars(),
-            ])
-            .drop_nulls()
-            .filter(
-                pl.col(self.mil_col).str.len_chars().gt(0)
-                & pl.col(self.photographer_col).str.len_chars().gt(0)
-            )
-        )
-
-        self.records = {
-            row[self.mil_col]: self._format_watermark(row[self.photographer_col])
-            for row in df.iter_rows(named=True)
-        }
+        suffix = f" / {self._WATERMARK_SUFFIX}"
+        records: Dict[str, str] = {}
+        for mil, photographer in pairs:
+            if mil is None or photographer is None:
+                continue
+            mil = mil.strip()
+            photographer = photographer.strip()
+            if mil and photographer:
+                records[mil] = photographer + suffix
+        self.records = records
 
         return self.records
 
@@ -137,6 +119,10 @@ class MetadataParser:
         """
         Return the watermark text for a given file stem (MIL number).
 
+        Record keys are already stripped during ``parse()``, and file stems
+        rarely carry surrounding whitespace, so the stem is looked up as is
+        first and only stripped on a miss.
+
         Args:
             file_stem (str): The image file stem to look up, expected to
                 match a MIL number in the metadata (e.g. ``"2314"``).
@@ -146,38 +132,95 @@ class MetadataParser:
                 (e.g. ``"HA York / ASM-MIL"``) if a match is found,
                 or ``None`` if the file stem is not in the records.
         """
-        return self.records.get(file_stem.strip())
+        return self.records.get(file_stem) or self.records.get(file_stem.strip())
 
-    def _load_file(self) -> pl.DataFrame:
+    def _load_file(self) -> List[Tuple[Optional[str], Optional[str]]]:
         """
         Dispatch file loading based on the file extension.
 
-        Polars reads all columns as strings (``infer_schema_length=0``) to
-        prevent MIL numbers from being silently cast to floats or integers,
-        which would break string-based key matching.
-
         Returns:
-            pl.DataFrame: Raw dataframe from the source file.
+            List[Tuple[str | None, str | None]]: Raw ``(mil, photographer)``
+                cell values for every data row, in file order.
+
+        Raises:
+            KeyError: If either column is missing from the header row.
         """
         suffix = self.file_path.suffix.lower()
         if suffix in (".xlsx", ".xls"):
-            return pl.read_excel(
-                self.file_path,
-                infer_schema_length=0,
+            return self._read_excel()
+        return self._read_csv()
+
+    def _read_csv(self) -> List[Tuple[Optional[str], Optional[str]]]:
+        """
+        Read the two needed columns from a CSV file with the ``csv`` module.
+
+        Every cell is kept as a string, so MIL numbers are never cast to
+        floats or integers, which would break string-based key matching.
+        A UTF-8 byte order mark, as written by Excel's CSV export, is
+        ignored. Rows too short to hold both columns are skipped.
+        """
+        with open(self.file_path, newline="", encoding="utf-8-sig") as f:
+            reader = csv.reader(f)
+            mil_idx, photographer_idx = self._column_indices(next(reader, []))
+            width = max(mil_idx, photographer_idx) + 1
+            return [
+                (row[mil_idx], row[photographer_idx])
+                for row in reader
+                if len(row) >= width
+            ]
+
+    def _read_excel(self) -> List[Tuple[Optional[str], Optional[str]]]:
+        """
+        Read the two needed columns from the first sheet of an Excel file.
+
+        The header row is read on its own first, then only the MIL number
+        and Photographer columns are loaded, as strings, through the
+        calamine-based ``fastexcel`` reader. ``fastexcel`` is imported here
+        so CSV-only runs never pay for it.
+        """
+        import fastexcel
+
+        reader = fastexcel.read_excel(self.file_path)
+        header = [
+            column.name
+            for column in reader.load_sheet(0, n_rows=0).available_columns()
+        ]
+        mil_idx, photographer_idx = self._column_indices(header)
+
+        df = reader.load_sheet(
+            0, use_columns=[mil_idx, photographer_idx], dtypes="string"
+        ).to_polars()
+        return list(
+            zip(
+                df.get_column(header[mil_idx]).to_list(),
+                df.get_column(header[photographer_idx]).to_list(),
             )
-        return pl.read_csv(
-            self.file_path,
-            infer_schema_length=0,
         )
 
-    def _format_watermark(self, photographer: str) -> str:
+    def _column_indices(self, header: Sequence[str]) -> Tuple[int, int]:
         """
-        Format a photographer name into the standard watermark string.
+        Locate the MIL number and Photographer columns in a header row.
+
+        Column names are stripped before matching.
 
         Args:
-            photographer (str): Photographer name as read from the metadata.
+            header (Sequence[str]): Raw column names from the source file.
 
         Returns:
-            str: Formatted string in the form ``"{photographer} / ASM-MIL"``.
+            Tuple[int, int]: Indices of the MIL number and Photographer
+                columns.
+
+        Raises:
+            KeyError: If either column cannot be found.
         """
-        return f"{photographer} / {self._WATERMARK_SUFFIX}"
+        columns = [str(col).strip() for col in header]
+        missing = [
+            col for col in (self.mil_col, self.photographer_col)
+            if col not in columns
+        ]
+        if missing:
+            raise KeyError(
+                f"Column(s) not found in metadata file: {missing}. "
+                f"Available columns: {columns}"
+            )
+        return columns.index(self.mil_col), columns.index(self.photographer_col)
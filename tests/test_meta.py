@@ -0,0 +1,155 @@
+from mil_kit.watermark.meta import MetadataParser
+from pathlib import Path
+from xml.sax.saxutils import escape
+import tempfile
+import zipfile
+
+
+def _write_xlsx(path, rows):
+    """Write a minimal single-sheet xlsx; numbers are stored as numeric cells."""
+
+    def cell(ref, value):
+        if isinstance(value, (int, float)):
+            return f'<c r="{ref}"><v>{value}</v></c>'
+        return (
+            f'<c r="{ref}" t="inlineStr"><is>'
+            f'<t xml:space="preserve">{escape(value)}</t></is></c>'
+        )
+
+    sheet_rows = "".join(
+        f'<row r="{r}">'
+        + "".join(
+            cell(f"{chr(ord('A') + c)}{r}", value)
+            for c, value in enumerate(row)
+            if value is not None
+        )
+        + "</row>"
+        for r, row in enumerate(rows, start=1)
+    )
+    main = "http://schemas.openxmlformats.org"
+    rels = f"{main}/officeDocument/2006/relationships"
+    with zipfile.ZipFile(path, "w") as xlsx:
+        xlsx.writestr(
+            "[Content_Types].xml",
+            f'<Types xmlns="{main}/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/'
+            'vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" ContentType="application/'
+            'vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/worksheets/sheet1.xml" ContentType="application/'
+            'vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+            "</Types>",
+        )
+        xlsx.writestr(
+            "_rels/.rels",
+            f'<Relationships xmlns="{main}/package/2006/relationships">'
+            f'<Relationship Id="rId1" Type="{rels}/officeDocument" '
+            'Target="xl/workbook.xml"/></Relationships>',
+        )
+        xlsx.writestr(
+            "xl/workbook.xml",
+            f'<workbook xmlns="{main}/spreadsheetml/2006/main" xmlns:r="{rels}">'
+            '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets>'
+            "</workbook>",
+        )
+        xlsx.writestr(
+            "xl/_rels/workbook.xml.rels",
+            f'<Relationships xmlns="{main}/package/2006/relationships">'
+            f'<Relationship Id="rId1" Type="{rels}/worksheet" '
+            'Target="worksheets/sheet1.xml"/></Relationships>',
+        )
+        xlsx.writestr(
+            "xl/worksheets/sheet1.xml",
+            f'<worksheet xmlns="{main}/spreadsheetml/2006/main">'
+            f"<sheetData>{sheet_rows}</sheetData></worksheet>",
+        )
+
+
+def test_parse_csv_builds_watermark_records():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        meta_file = Path(tmpdirname) / "meta.csv"
+        meta_file.write_text(
+            " MIL # ,Species,Photographer\n"
+            "2314,Mus musculus,HA York\n"
+            " 2315 ,Rattus rattus, J Doe \n"
+            "2316,Rattus rattus,\n"
+            ",Mus musculus,Nobody\n"
+        )
+
+        parser = MetadataParser(meta_file)
+        records = parser.parse()
+
+        assert records == {
+            "2314": "HA York / ASM-MIL",
+            "2315": "J Doe / ASM-MIL",
+        }
+        assert parser.get_watermark_text("2314") == "HA York / ASM-MIL"
+        assert parser.get_watermark_text("2315 ") == "J Doe / ASM-MIL"
+        assert parser.get_watermark_text("9999") is None
+
+
+def test_parse_missing_column_raises():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        meta_file = Path(tmpdirname) / "meta.csv"
+        meta_file.write_text("MIL #,Species\n2314,Mus musculus\n")
+
+        parser = MetadataParser(meta_file)
+        try:
+            parser.parse()
+        except KeyError as e:
+            assert "Photographer" in str(e)
+        else:
+            raise AssertionError("Expected KeyError for missing column")
+
+
+def test_parse_csv_with_bom_and_short_rows():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        meta_file = Path(tmpdirname) / "meta.csv"
+        meta_file.write_text(
+            "\ufeffMIL #,Species,Notes,Photographer\n"
+            "2314,Mus musculus,a,HA York\n"
+            "2315,Rattus rattus\n",
+            encoding="utf-8",
+        )
+
+        records = MetadataParser(meta_file).parse()
+
+        assert records == {"2314": "HA York / ASM-MIL"}
+
+
+def test_parse_xlsx_builds_watermark_records():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        meta_file = Path(tmpdirname) / "meta.xlsx"
+        _write_xlsx(
+            meta_file,
+            [
+                [" MIL # ", "Species", "Notes", " Photographer "],
+                [2314, "Mus musculus", "a", "HA York"],
+                [" 2315 ", "Rattus rattus", "b", " J Doe "],
+                [2316, "Rattus rattus", "c", None],
+                [2317, "Rattus rattus", "d", ""],
+                [None, "Mus musculus", "e", "Nobody"],
+            ],
+        )
+
+        parser = MetadataParser(meta_file)
+        records = parser.parse()
+
+        assert records == {
+            "2314": "HA York / ASM-MIL",
+            "2315": "J Doe / ASM-MIL",
+        }
+
+
+def test_parse_xlsx_missing_column_raises():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        meta_file = Path(tmpdirname) / "meta.xlsx"
+        _write_xlsx(meta_file, [["MIL #", "Species"], [2314, "Mus musculus"]])
+
+        try:
+            MetadataParser(meta_file).parse()
+        except KeyError as e:
+            assert "Photographer" in str(e)
+        else:
+            raise AssertionError("Expected KeyError for missing column")
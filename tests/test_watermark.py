@@ -0,0 +1,209 @@
+from mil_kit.watermark.add import WatermarkProcessor
+from pathlib import Path
+from PIL import Image, ImageDraw
+import tempfile
+
+WATERMARK_TEXT = "HA York / ASM-MIL"
+
+
+def _make_image(path, size=(400, 300), mode="RGB"):
+    Image.new(mode, size, (200, 180, 160)).save(path)
+
+
+def test_watermark_only_touches_bottom_left():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_path = Path(tmpdirname) / "input.png"
+        _make_image(input_path)
+
+        processor = WatermarkProcessor(input_path, watermark_text=WATERMARK_TEXT)
+        processor.load()
+        original = processor.image.copy()
+        processor.apply_text_watermark()
+
+        width, height = original.size
+        # Top-right corner is far from the pill and must be unchanged
+        assert processor.watermarked.getpixel((width - 1, 0)) == original.getpixel(
+            (width - 1, 0)
+        )
+        # Pill background darkens the bottom-left corner
+        pill_pixel = processor.watermarked.getpixel((8, height - 8))
+        assert pill_pixel[0] < original.getpixel((8, height - 8))[0]
+
+
+def test_watermark_keeps_glyph_ink_below_the_pill():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_path = Path(tmpdirname) / "input.png"
+        _make_image(input_path, size=(1920, 1280))
+
+        processor = WatermarkProcessor(
+            input_path, watermark_text="J Doe / ASM-MIL (Myotis lucifugus)"
+        )
+        processor.load()
+        original = processor.image.copy()
+        processor.apply_text_watermark()
+
+        # Descenders of "J", "/" and ")" reach into the bottom margin,
+        # below the pill background
+        pill_bottom = 1280 - WatermarkProcessor._MARGIN
+        margin = (0, pill_bottom + 1, 1920, 1280)
+        assert processor.watermarked.crop(margin).tobytes() != original.crop(
+            margin
+        ).tobytes()
+
+
+def test_pill_tile_is_cached_and_left_unchanged():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        # Same width, different heights: the pill tile depends only on width
+        processors = []
+        for i, size in enumerate([(640, 300), (640, 480)]):
+            input_path = Path(tmpdirname) / f"{i}.png"
+            _make_image(input_path, size=size)
+            processors.append(
+                WatermarkProcessor(input_path, watermark_text=WATERMARK_TEXT)
+            )
+
+        first, second = processors
+        first.load()
+        first.apply_text_watermark()
+
+        font_size = max(WatermarkProcessor._MIN_FONT_SIZE, 640 // 40)
+        max_text_width = 640 - 2 * (
+            WatermarkProcessor._MARGIN + WatermarkProcessor._PADDING
+        )
+        tile_args = (
+            first.watermark_text,
+            font_size,
+            max_text_width,
+            first._bg_rgba,
+            first._text_rgba,
+        )
+        tile, _ = WatermarkProcessor._render_pill_tile(*tile_args)
+        rendered = tile.tobytes()
+
+        hits = WatermarkProcessor._render_pill_tile.cache_info().hits
+        second.load()
+        second.apply_text_watermark()
+        assert WatermarkProcessor._render_pill_tile.cache_info().hits == hits + 1
+
+        # The cached tile must not be modified by compositing
+        cached, _ = WatermarkProcessor._render_pill_tile(*tile_args)
+        assert cached is tile
+        assert cached.tobytes() == rendered
+
+
+def test_watermark_long_text_stays_in_bounds():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_path = Path(tmpdirname) / "input.png"
+        _make_image(input_path, size=(120, 80))
+
+        processor = WatermarkProcessor(input_path, watermark_text="x" * 200)
+        processor.load()
+        processor.apply_text_watermark()
+
+        assert processor.watermarked.size == (120, 80)
+
+
+def test_watermark_export_jpeg():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_path = Path(tmpdirname) / "input.png"
+        _make_image(input_path)
+
+        processor = WatermarkProcessor(input_path, watermark_text=WATERMARK_TEXT)
+        processor.load()
+        processor.apply_text_watermark()
+
+        output_path = Path(tmpdirname) / "output.jpg"
+        processor.export(output_path, format="jpeg", max_resolution=200)
+        assert output_path.exists()
+
+        with Image.open(output_path) as img:
+            assert img.mode == "RGB"
+            assert max(img.size) <= 200
+
+
+def test_wrap_text_respects_max_width():
+    font = WatermarkProcessor._load_font(size=16)
+    draw = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+    text = "© Photographer With A Rather Long Name / ASM-MIL"
+
+    lines, widths = WatermarkProcessor._wrap_text(text, font, 160, draw)
+
+    assert len(lines) > 1
+    assert " ".join(lines) == text
+    for line, width in zip(lines, widths):
+        assert width <= 160
+        assert abs(draw.textlength(line, font=font) - width) <= 1
+
+
+def test_watermark_keeps_rgb_source_mode():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_path = Path(tmpdirname) / "input.jpg"
+        _make_image(input_path)
+
+        processor = WatermarkProcessor(input_path, watermark_text=WATERMARK_TEXT)
+        processor.load()
+        processor.apply_text_watermark()
+
+        assert processor.image.mode == "RGB"
+        assert processor.watermarked.mode == "RGB"
+
+
+def test_load_jpeg_draft_with_max_resolution():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_path = Path(tmpdirname) / "input.jpg"
+        _make_image(input_path, size=(1600, 1200))
+
+        processor = WatermarkProcessor(input_path, watermark_text=WATERMARK_TEXT)
+        processor.load(max_resolution=400)
+
+        # libjpeg scales by 1/2, 1/4 or 1/8 without going below the target
+        assert processor.image.size == (400, 300)
+
+        processor.apply_text_watermark()
+        output_path = Path(tmpdirname) / "output.jpg"
+        processor.export(output_path, format="jpeg", max_resolution=400)
+
+        with Image.open(output_path) as img:
+            assert img.size == (400, 300)
+
+
+def test_export_accepts_jpg_alias():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_path = Path(tmpdirname) / "input.png"
+        _make_image(input_path)
+
+        processor = WatermarkProcessor(input_path, watermark_text=WATERMARK_TEXT)
+        processor.load()
+        processor.apply_text_watermark()
+
+        output_path = Path(tmpdirname) / "output.jpg"
+        processor.export(output_path, format="jpg")
+
+        with Image.open(output_path) as img:
+            assert img.format == "JPEG"
+
+
+def test_export_skips_resize_when_image_fits():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_path = Path(tmpdirname) / "input.png"
+        _make_image(input_path)
+
+        processor = WatermarkProcessor(input_path, watermark_text=WATERMARK_TEXT)
+        processor.load()
+        processor.apply_text_watermark()
+
+        output_path = Path(tmpdirname) / "output.png"
+        processor.export(output_path, format="png", max_resolution=1000)
+
+        with Image.open(output_path) as img:
+            assert img.size == (400, 300)
+
+
+def test_wrap_text_single_line_when_it_fits():
+    font = WatermarkProcessor._load_font(size=16)
+    draw = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+
+    lines, widths = WatermarkProcessor._wrap_text(WATERMARK_TEXT, font, 1000, draw)
+
+    assert lines == [WATERMARK_TEXT]
+    assert widths == [draw.textlength(WATERMARK_TEXT, font=font)]
@@ -0,0 +1,353 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from mil_kit.watermark import batch
+from mil_kit.watermark.batch import WatermarkJob, _watermark_bytes, _write_atomic
+from pathlib import Path
+from PIL import Image
+import io
+import os
+import tempfile
+
+
+def _make_images(input_dir, names, size=(400, 300)):
+    for name in names:
+        Image.new("RGB", size, (200, 180, 160)).save(input_dir / name)
+
+
+def _crashing_watermark_bytes(data, image_path, *args):
+    # Simulates a worker killed mid-file (e.g. by the OOM killer)
+    if image_path.stem == "crash":
+        os._exit(1)
+    return _watermark_bytes(data, image_path, *args)
+
+
+def test_watermark_bytes_in_process_pool():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_path = Path(tmpdirname) / "input.jpg"
+        _make_images(Path(tmpdirname), ["input.jpg"])
+        data = input_path.read_bytes()
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            ok = executor.submit(
+                _watermark_bytes, data, input_path, "© x", 0.8, "png", None
+            )
+            bad = executor.submit(
+                _watermark_bytes, b"not an image", input_path, "© x", 0.8, "png", None
+            )
+            encoded = ok.result()
+            assert bad.exception() is not None
+
+        with Image.open(io.BytesIO(encoded)) as img:
+            assert img.format == "PNG"
+            assert img.size == (400, 300)
+
+
+def test_watermark_job_with_fallback_text():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_dir = Path(tmpdirname) / "input"
+        output_dir = Path(tmpdirname) / "output"
+        input_dir.mkdir()
+        names = [f"{i}.jpg" for i in range(6)]
+        _make_images(input_dir, names)
+
+        job = WatermarkJob(
+            input_dir=input_dir,
+            watermark_text="2024 ASM-MIL",
+            output_dir=output_dir,
+            verbose=False,
+        )
+        stats = job.run()
+
+        assert stats["success"] == len(names)
+        # overwrite defaults to True, so output directories are never listed
+        assert job._existing_outputs == {}
+        for name in names:
+            assert (output_dir / f"{Path(name).stem}.png").exists()
+
+
+def test_watermark_job_with_metadata():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_dir = Path(tmpdirname) / "input"
+        output_dir = Path(tmpdirname) / "output"
+        input_dir.mkdir()
+        _make_images(input_dir, ["2314.jpg", "2315.jpg", "9999.jpg", "2316.png"])
+
+        meta_file = Path(tmpdirname) / "meta.csv"
+        meta_file.write_text(
+            "MIL #,Photographer,Notes\n"
+            "2314,HA York,a\n"
+            "2315,J Doe,b\n"
+            "2316,J Doe,c\n"
+        )
+
+        job = WatermarkJob(
+            input_dir=input_dir,
+            meta_file=meta_file,
+            output_dir=output_dir,
+            output_format="jpg",
+            verbose=False,
+        )
+        stats = job.run()
+
+        assert stats["success"] == 3
+        assert stats["no_metadata"] == 1
+        assert stats["failed"] == 0
+        assert job.failed_files == []
+        assert (output_dir / "2314.jpg").exists()
+        assert (output_dir / "no_metadata" / "9999.jpg").exists()
+        assert not (output_dir / "9999.jpg").exists()
+
+
+def test_watermark_job_survives_worker_crash(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_dir = Path(tmpdirname) / "input"
+        output_dir = Path(tmpdirname) / "output"
+        input_dir.mkdir()
+        names = ["crash.jpg"] + [f"{i}.jpg" for i in range(39)]
+        _make_images(input_dir, names, size=(64, 48))
+        monkeypatch.setattr(batch, "_watermark_bytes", _crashing_watermark_bytes)
+
+        job = WatermarkJob(
+            input_dir=input_dir,
+            watermark_text="x",
+            output_dir=output_dir,
+            max_workers=2,
+            verbose=False,
+        )
+        stats = job.run()
+
+        # Files that shared the broken pool are retried; only the crasher fails
+        assert stats["success"] == len(names) - 1
+        assert stats["failed"] == 1
+        assert job.failed_files == [input_dir / "crash.jpg"]
+        assert (output_dir / "failed_files" / "crash.jpg").exists()
+
+
+def test_watermark_job_skips_existing_outputs():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_dir = Path(tmpdirname) / "input"
+        output_dir = Path(tmpdirname) / "output"
+        input_dir.mkdir()
+        output_dir.mkdir()
+        _make_images(input_dir, ["a.jpg", "b.jpg", "b.webp"])
+        (output_dir / "a.png").write_bytes(b"existing")
+
+        job = WatermarkJob(
+            input_dir=input_dir,
+            watermark_text="x",
+            output_dir=output_dir,
+            overwrite=False,
+            verbose=True,
+        )
+        stats = job.run()
+
+        assert stats["success"] == 1
+        assert stats["skipped"] == 2
+        assert stats["failed"] == 0
+        assert (output_dir / "a.png").read_bytes() == b"existing"
+        assert (output_dir / "b.png").exists()
+        assert list(job._existing_outputs) == [output_dir]
+
+
+def test_watermark_job_does_not_rediscover_outputs_in_input_dir():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_dir = Path(tmpdirname)
+        # Enough entries that the directory is listed in several batches
+        names = [f"{i}.jpg" for i in range(1500)]
+        _make_images(input_dir, names, size=(16, 12))
+
+        job = WatermarkJob(input_dir=input_dir, watermark_text="x", verbose=False)
+        stats = job.run()
+
+        assert stats["success"] == len(names)
+        assert stats["failed"] == 0
+
+
+def test_watermark_job_skips_outputs_nested_in_input_dir():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_dir = Path(tmpdirname) / "input"
+        output_dir = input_dir / "zz_output"
+        nested_dir = input_dir / "nested"
+        nested_dir.mkdir(parents=True)
+        _make_images(input_dir, ["a.jpg", "b.jpg"])
+        _make_images(nested_dir, ["c.jpg", "d.jpg"])
+
+        job = WatermarkJob(
+            input_dir=input_dir,
+            watermark_text="x",
+            output_dir=output_dir,
+            recursive=True,
+            verbose=False,
+        )
+        stats = job.run()
+
+        assert stats["success"] == 4
+        assert (output_dir / "a.png").exists()
+        assert (output_dir / "nested" / "c.png").exists()
+        assert not (output_dir / "zz_output").exists()
+
+
+def test_watermark_job_rerun_keeps_no_metadata_copies():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_dir = Path(tmpdirname) / "input"
+        input_dir.mkdir()
+        _make_images(input_dir, ["2314.jpg", "9999.jpg"])
+
+        meta_file = Path(tmpdirname) / "meta.csv"
+        meta_file.write_text("MIL #,Photographer\n2314,HA York\n")
+
+        for _ in range(2):
+            # The second, recursive run also discovers no_metadata/9999.jpg
+            stats = WatermarkJob(
+                input_dir=input_dir,
+                meta_file=meta_file,
+                recursive=True,
+                verbose=False,
+            ).run()
+
+        assert stats["no_metadata"] == 2
+        review_copy = input_dir / "no_metadata" / "9999.jpg"
+        assert review_copy.read_bytes() == (input_dir / "9999.jpg").read_bytes()
+        assert sorted(p.name for p in review_copy.parent.iterdir()) == ["9999.jpg"]
+
+
+def test_watermark_job_skips_unreadable_directories(monkeypatch):
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_dir = Path(tmpdirname) / "input"
+        output_dir = Path(tmpdirname) / "output"
+        locked_dir = input_dir / "locked"
+        locked_dir.mkdir(parents=True)
+        _make_images(input_dir, ["a.jpg", "b.jpg"])
+        _make_images(input_dir / "locked", ["c.jpg"])
+        (input_dir / "open").mkdir()
+        _make_images(input_dir / "open", ["d.jpg", "e.jpg"])
+
+        scandir = os.scandir
+
+        def guarded_scandir(path="."):
+            if isinstance(path, (str, os.PathLike)) and Path(path) == locked_dir:
+                raise PermissionError(13, "Permission denied", str(path))
+            return scandir(path)
+
+        monkeypatch.setattr(os, "scandir", guarded_scandir)
+        job = WatermarkJob(
+            input_dir=input_dir,
+            watermark_text="x",
+            output_dir=output_dir,
+            recursive=True,
+            verbose=False,
+        )
+        stats = job.run()
+
+        assert stats["success"] == 4
+        assert stats["failed"] == 0
+        assert not (output_dir / "locked").exists()
+
+
+def test_watermark_job_mirrors_into_input_dir_given_as_another_path():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_dir = Path(tmpdirname) / "input"
+        nested_dir = input_dir / "sub"
+        nested_dir.mkdir(parents=True)
+        _make_images(input_dir, ["a.jpg"])
+        _make_images(nested_dir, ["c.jpg"])
+
+        # Same directory, spelled differently (as with ``-d in -o /abs/in``)
+        job = WatermarkJob(
+            input_dir=input_dir,
+            watermark_text="x",
+            output_dir=input_dir / "sub" / "..",
+            recursive=True,
+            verbose=False,
+        )
+        stats = job.run()
+
+        assert stats["success"] == 2
+        assert (input_dir / "a.png").exists()
+        assert (nested_dir / "c.png").exists()
+        assert not (input_dir / "c.png").exists()
+
+
+def test_watermark_job_finds_files_recursively():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_dir = Path(tmpdirname) / "input"
+        nested_dir = input_dir / "nested"
+        nested_dir.mkdir(parents=True)
+        _make_images(input_dir, ["a.jpg", "b.PNG"])
+        _make_images(nested_dir, ["c.webp"])
+        (input_dir / "notes.txt").write_text("not an image")
+        (input_dir / "folder.jpg").mkdir()
+
+        flat = WatermarkJob(input_dir=input_dir, watermark_text="x", verbose=False)
+        assert sorted(p.name for p in flat._get_files()) == ["a.jpg", "b.PNG"]
+
+        recursive = WatermarkJob(
+            input_dir=input_dir, watermark_text="x", recursive=True, verbose=False
+        )
+        assert sorted(p.name for p in recursive._get_files()) == [
+            "a.jpg",
+            "b.PNG",
+            "c.webp",
+        ]
+
+
+def test_watermark_job_mirrors_subdirectories():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        input_dir = Path(tmpdirname) / "input"
+        output_dir = Path(tmpdirname) / "output"
+        nested_dir = input_dir / "nested"
+        nested_dir.mkdir(parents=True)
+        _make_images(input_dir, ["a.jpg"])
+        _make_images(nested_dir, ["b.jpg", "c.jpg"])
+
+        job = WatermarkJob(
+            input_dir=input_dir,
+            watermark_text="x",
+            output_dir=output_dir,
+            recursive=True,
+            verbose=False,
+        )
+        stats = job.run()
+
+        assert stats["success"] == 3
+        assert (output_dir / "a.png").exists()
+        assert (output_dir / "nested" / "b.png").exists()
+        assert (output_dir / "nested" / "c.png").exists()
+
+
+def test_write_atomic_concurrent_writes_to_one_destination():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        dest_path = Path(tmpdirname) / "a.png"
+        payloads = [bytes([i]) * 4096 for i in range(40)]
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(_write_atomic, dest_path, payload)
+                for payload in payloads
+            ]
+            for future in futures:
+                future.result()
+
+        assert dest_path.read_bytes() in payloads
+        assert [p.name for p in Path(tmpdirname).iterdir()] == ["a.png"]
+
+
+def test_write_atomic_replaces_and_cleans_up():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        dest_path = Path(tmpdirname) / "a.png"
+        dest_path.write_bytes(b"old")
+
+        _write_atomic(dest_path, b"new")
+        assert dest_path.read_bytes() == b"new"
+
+        # A non-empty directory cannot be replaced by a file
+        blocked = Path(tmpdirname) / "b.png"
+        blocked.mkdir()
+        (blocked / "keep").write_bytes(b"")
+        try:
+            _write_atomic(blocked, b"new")
+        except OSError:
+            pass
+        else:
+            raise AssertionError("Expected OSError when replacing a directory")
+
+        assert sorted(p.name for p in Path(tmpdirname).iterdir()) == ["a.png", "b.png"]